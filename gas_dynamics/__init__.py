@@ -63,6 +63,7 @@ from gas_dynamics.rayleigh.rayleigh import(
   rayleigh_density_ratio,
   rayleigh_stagnation_temperature_ratio,
   rayleigh_stagnation_pressure_ratio,
+  rayleigh_all_ratios,
   rayleigh_mach_from_pressure_ratio,
   rayleigh_mach_from_temperature_ratio,
   rayleigh_mach_from_stagnation_temperature_ratio,
@@ -72,6 +73,7 @@ from gas_dynamics.rayleigh.rayleigh import(
   rayleigh_density_star_ratio,
   rayleigh_stagnation_pressure_star_ratio,
   rayleigh_stagnation_temperature_star_ratio,
+  rayleigh_all_star_ratios,
   rayleigh_heat_flux)
 
 from gas_dynamics.fluids import fluid
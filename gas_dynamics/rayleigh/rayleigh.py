@@ -6,14 +6,39 @@
 #
 #Copyright 2020 by Fernando A de la Fuente
 #All rights reserved
+from collections import namedtuple
+from functools import lru_cache
+from math import sqrt, log, inf
+import numpy as np
 from gas_dynamics.fluids import fluid, air
-from scipy.optimize import fsolve
+
+
+#==================================================
+#gas constants
+#derived constants of gamma reused across the ratio
+#functions, cached on the value and type of gamma
+#==================================================
+@lru_cache(maxsize=8, typed=True)
+def _gas_constants(gamma):
+    return gamma, (gamma-1)/2, gamma+1, gamma/(gamma-1)
+
+
+
+#==================================================
+#isentropic power
+#x**(gamma/(gamma-1)) given the exponent already
+#unpacked from the cached constants, a vectorized
+#power for arrays
+#==================================================
+def _isentropic_power(x, gamma_over_gm1):
+    return x**gamma_over_gm1
+
 
 
 #==================================================
 #rayleigh pressure ratio
 #==================================================
-def rayleigh_pressure_ratio(mach_initial: float, mach_final:float, gas=air) -> float:
+def rayleigh_pressure_ratio(mach_initial, mach_final, gas=air):
     """Return the pressure ratio pressure_final / pressure_initial given the two Mach numbers
 
     Notes
@@ -24,16 +49,16 @@ def rayleigh_pressure_ratio(mach_initial: float, mach_final:float, gas=air) -> f
 
     Parameters
     ----------
-    mach_initial : `flaot`
+    mach_initial : `float` or `array_like`
         The Mach number at region 1\n
-    mach_final : `float`
+    mach_final : `float` or `array_like`
         The Mach number at region 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
 
     Returns
     -------
-    float
+    float or ndarray
         The rayleigh pressure ratio pressure_final / pressure_initial \n
     
     Examples
@@ -46,7 +71,10 @@ def rayleigh_pressure_ratio(mach_initial: float, mach_final:float, gas=air) -> f
     >>>
     """
     gamma = gas.gamma
-    p2_p1 = (1 + gamma * mach_initial**2)/(1 + gamma *  mach_final**2)
+    if type(mach_initial) is not float or type(mach_final) is not float:
+        mach_initial, mach_final = np.asarray(mach_initial), np.asarray(mach_final)
+    M1sq, M2sq = mach_initial*mach_initial, mach_final*mach_final
+    p2_p1 = (1 + gamma*M1sq)/(1 + gamma*M2sq)
     return p2_p1
 
 
@@ -54,7 +82,7 @@ def rayleigh_pressure_ratio(mach_initial: float, mach_final:float, gas=air) -> f
 #==================================================
 #rayleigh temperature ratio
 #==================================================
-def rayleigh_temperature_ratio(mach_initial: float, mach_final: float, gas=air) -> float:
+def rayleigh_temperature_ratio(mach_initial, mach_final, gas=air):
     """Return the temperature ratio T2/T1 given the two Mach numbers
 
     Notes
@@ -65,16 +93,16 @@ def rayleigh_temperature_ratio(mach_initial: float, mach_final: float, gas=air)
 
     Parameters
     ----------
-    mach_initial : `flaot`
+    mach_initial : `float` or `array_like`
         The Mach number at region 1\n
-    mach_final : `float`
+    mach_final : `float` or `array_like`
         The Mach number at region 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
     
     Returns
     -------
-    float
+    float or ndarray
         The rayleigh temperature ratio T2 / T1 \n
 
     Examples
@@ -88,7 +116,11 @@ def rayleigh_temperature_ratio(mach_initial: float, mach_final: float, gas=air)
     """
 
     gamma = gas.gamma
-    T2_T1 = ((1 + gamma * mach_initial**2)/(1 + gamma *  mach_final**2))**2 * (mach_final**2)/(mach_initial**2)
+    if type(mach_initial) is not float or type(mach_final) is not float:
+        mach_initial, mach_final = np.asarray(mach_initial), np.asarray(mach_final)
+    M1sq, M2sq = mach_initial*mach_initial, mach_final*mach_final
+    a1, a2 = 1 + gamma*M1sq, 1 + gamma*M2sq
+    T2_T1 = (a1*a1*M2sq)/(a2*a2*M1sq)
     return T2_T1
 
 
@@ -98,7 +130,7 @@ def rayleigh_temperature_ratio(mach_initial: float, mach_final: float, gas=air)
 #TODO: docstring and examples
 #TODO: verify
 #==================================================
-def rayleigh_density_ratio(mach_initial: float, mach_final: float, gas=air) -> float:
+def rayleigh_density_ratio(mach_initial, mach_final, gas=air):
     """Return the density ratio rho2/rho1 given the two Mach numbers
 
     Notes
@@ -109,16 +141,16 @@ def rayleigh_density_ratio(mach_initial: float, mach_final: float, gas=air) -> f
 
     Parameters
     ----------
-    mach_initial : `flaot`
+    mach_initial : `float` or `array_like`
         The Mach number at region 1\n
-    mach_final : `float`
+    mach_final : `float` or `array_like`
         The Mach number at region 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
     
     Returns
     -------
-    float
+    float or ndarray
         The rayleigh density ratio rho2 / rho1 \n
 
     Examples
@@ -127,7 +159,10 @@ def rayleigh_density_ratio(mach_initial: float, mach_final: float, gas=air) -> f
     """
 
     gamma = gas.gamma
-    rho2_rho1 = (1 + gamma * mach_final**2)/(1 + gamma *  mach_initial**2) * (mach_initial**2)/(mach_final**2)
+    if type(mach_initial) is not float or type(mach_final) is not float:
+        mach_initial, mach_final = np.asarray(mach_initial), np.asarray(mach_final)
+    M1sq, M2sq = mach_initial*mach_initial, mach_final*mach_final
+    rho2_rho1 = ((1 + gamma*M2sq)*M1sq)/((1 + gamma*M1sq)*M2sq)
     return rho2_rho1
 
 
@@ -135,7 +170,7 @@ def rayleigh_density_ratio(mach_initial: float, mach_final: float, gas=air) -> f
 #==================================================
 #rayleigh stagnation temperature ratio
 #==================================================
-def rayleigh_stagnation_temperature_ratio(mach_initial: float, mach_final: float, gas=air) -> float:
+def rayleigh_stagnation_temperature_ratio(mach_initial, mach_final, gas=air):
     """Return the stagnation temperature ratio Tt2/Tt1 given the two Mach numbers
 
     Notes
@@ -146,16 +181,16 @@ def rayleigh_stagnation_temperature_ratio(mach_initial: float, mach_final: float
 
     Parameters
     ----------
-    mach_initial : `flaot`
+    mach_initial : `float` or `array_like`
         The Mach number at region 1\n
-    mach_final : `float`
+    mach_final : `float` or `array_like`
         The Mach number at region 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
     
     Returns
     -------
-    float
+    float or ndarray
         The rayleigh stagnation temperature ratio pt2 / pt1 \n
 
     Examples
@@ -167,8 +202,12 @@ def rayleigh_stagnation_temperature_ratio(mach_initial: float, mach_final: float
     0.35983309042974404
     >>>
     """
-    gamma = gas.gamma
-    Tt2_Tt1 = ((1+gamma*mach_initial**2)/(1+gamma*mach_final**2))**2 * (mach_final**2)/(mach_initial**2) * ((1+(gamma-1)/2*mach_final**2)/(1+(gamma-1)/2*mach_initial**2))
+    gamma, gm1_over_2, _, _ = _gas_constants(gas.gamma)
+    if type(mach_initial) is not float or type(mach_final) is not float:
+        mach_initial, mach_final = np.asarray(mach_initial), np.asarray(mach_final)
+    M1sq, M2sq = mach_initial*mach_initial, mach_final*mach_final
+    a1, a2 = 1 + gamma*M1sq, 1 + gamma*M2sq
+    Tt2_Tt1 = (a1*a1 * M2sq*(1 + gm1_over_2*M2sq)) / (a2*a2 * M1sq*(1 + gm1_over_2*M1sq))
     return Tt2_Tt1
 
 
@@ -176,7 +215,7 @@ def rayleigh_stagnation_temperature_ratio(mach_initial: float, mach_final: float
 #==================================================
 #rayleigh stagnation pressure ratio
 #==================================================
-def rayleigh_stagnation_pressure_ratio(mach_initial: float, mach_final: float, gas=air) -> float:
+def rayleigh_stagnation_pressure_ratio(mach_initial, mach_final, gas=air):
     """Return the stagnation pressure ratio pt2/pt1 given the two Mach numbers
 
     Notes
@@ -187,16 +226,16 @@ def rayleigh_stagnation_pressure_ratio(mach_initial: float, mach_final: float, g
 
     Parameters
     ----------
-    mach_initial : `flaot`
+    mach_initial : `float` or `array_like`
         The Mach number at region 1\n
-    mach_final : `float`
+    mach_final : `float` or `array_like`
         The Mach number at region 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
     
     Returns
     -------
-    float
+    float or ndarray
         The rayleigh stagnation pressure ratio pt2 / pt1 \n
 
     Examples
@@ -209,16 +248,88 @@ def rayleigh_stagnation_pressure_ratio(mach_initial: float, mach_final: float, g
     >>>
     """
 
-    gamma = gas.gamma
-    pt2_pt1 = (1+gamma*mach_initial**2)/(1+gamma*mach_final**2) * ((1+(gamma-1)/2*mach_final**2)/(1+(gamma-1)/2*mach_initial**2))**(gamma/(gamma-1))
+    gamma, gm1_over_2, _, gamma_over_gm1 = _gas_constants(gas.gamma)
+    if type(mach_initial) is not float or type(mach_final) is not float:
+        mach_initial, mach_final = np.asarray(mach_initial), np.asarray(mach_final)
+    M1sq, M2sq = mach_initial*mach_initial, mach_final*mach_final
+    pt2_pt1 = (1 + gamma*M1sq)/(1 + gamma*M2sq) * _isentropic_power((1 + gm1_over_2*M2sq)/(1 + gm1_over_2*M1sq), gamma_over_gm1)
     return pt2_pt1
 
 
 
+#==================================================
+#rayleigh all ratios
+#==================================================
+rayleigh_ratios = namedtuple('rayleigh_ratios', ['p2_p1', 'T2_T1', 'rho2_rho1', 'Tt2_Tt1', 'pt2_pt1'])
+
+
+def rayleigh_all_ratios(mach_initial, mach_final, gas=air, dtype=None) -> rayleigh_ratios:
+    """Return the pressure, temperature, density, stagnation temperature and stagnation
+    pressure ratios given the two Mach numbers
+
+    Notes
+    -----
+    Given two Mach numbers, determine all five of the ratios of region two over region
+    one in the non-adiabatic constant area frictionless flow in a single pass. The
+    subexpressions shared between the ratios are evaluated once, which is cheaper than
+    calling each of the ratio functions when building tables. Default fluid is air.
+
+    Parameters
+    ----------
+    mach_initial : `float` or `array_like`
+        The Mach number at region 1\n
+    mach_final : `float` or `array_like`
+        The Mach number at region 2\n
+    gas : `fluid`
+        A user defined fluid object. Default is air \n
+    dtype : `data-type`
+        The floating point type to compute in, such as np.float32 for large sweeps
+        where single precision is enough, must be a floating point type. Default keeps
+        the precision of the input \n
+
+    Returns
+    -------
+    rayleigh_ratios
+        A named tuple of p2_p1, T2_T1, rho2_rho1, Tt2_Tt1, and pt2_pt1 \n
+
+    Examples
+    --------
+    >>> import gas_dynamics as gd
+    >>> mach_initial, mach_final = .8, .3
+    >>> ratios = gd.rayleigh_all_ratios(mach_initial, mach_final)
+    >>> ratios.T2_T1
+    0.39871485855083627
+    >>> ratios.pt2_pt1
+    1.1758050380938454
+    >>>
+    """
+
+    gamma, gm1_over_2, _, gamma_over_gm1 = _gas_constants(float(gas.gamma))
+    if dtype is None:
+        if type(mach_initial) is not float or type(mach_final) is not float:
+            mach_initial, mach_final = np.asarray(mach_initial), np.asarray(mach_final)
+    else:
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError('dtype must be a floating point type, got %s' % np.dtype(dtype))
+        mach_initial, mach_final = np.asarray(mach_initial, dtype=dtype), np.asarray(mach_final, dtype=dtype)
+        cast = np.dtype(dtype).type
+        gamma, gm1_over_2 = cast(gamma), cast(gm1_over_2)
+    M1sq, M2sq = mach_initial*mach_initial, mach_final*mach_final
+    p2_p1 = (1 + gamma*M1sq)/(1 + gamma*M2sq)
+    M2sq_M1sq = M2sq/M1sq
+    Tt_ratio = (1 + gm1_over_2*M2sq)/(1 + gm1_over_2*M1sq)
+    T2_T1 = p2_p1*p2_p1*M2sq_M1sq
+    rho2_rho1 = 1/(p2_p1*M2sq_M1sq)
+    Tt2_Tt1 = T2_T1*Tt_ratio
+    pt2_pt1 = p2_p1*_isentropic_power(Tt_ratio, gamma_over_gm1)
+    return rayleigh_ratios(p2_p1, T2_T1, rho2_rho1, Tt2_Tt1, pt2_pt1)
+
+
+
 #==================================================
 #rayleigh mach from pressure ratio
 #==================================================
-def rayleigh_mach_from_pressure_ratio(mach_initial: float, pressure_initial: float, pressure_final: float, gas=air) -> float:
+def rayleigh_mach_from_pressure_ratio(mach_initial, pressure_initial, pressure_final, gas=air):
     """Return the mach number given the Mach number and two pressures
 
     Notes
@@ -229,18 +340,18 @@ def rayleigh_mach_from_pressure_ratio(mach_initial: float, pressure_initial: flo
 
     Parameters
     ----------
-    M : `float`
-        The Mach number\n
-    pressure_initial : `flaot`
+    mach_initial : `float` or `array_like`
+        The initial Mach number\n
+    pressure_initial : `float` or `array_like`
         pressure 1\n
-    pressure_final : `float`
+    pressure_final : `float` or `array_like`
         pressure 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
     
     Returns
     -------
-    float
+    float or ndarray
         The resulting Mach number \n
 
     Examples
@@ -248,42 +359,51 @@ def rayleigh_mach_from_pressure_ratio(mach_initial: float, pressure_initial: flo
     >>> import gas_dynamics as gd                                        
     >>> mach_final = gd.rayleigh_mach_from_pressure_ratio(mach_initial=.8, pressure_initial=1.5, pressure_final=2.5) 
     >>> mach_final
-    0.31350552512789054
+    0.3135055251278903
     >>>
     """
 
     gamma = gas.gamma
-    mach_final = (((pressure_initial*(1+gamma*mach_initial**2))/pressure_final -1)/gamma)**.5
-    return mach_final
+    M2sq = (pressure_initial*(1 + gamma*mach_initial*mach_initial)/pressure_final - 1)/gamma
+    #no real Mach number gives nan
+    if type(M2sq) is float:
+        return sqrt(M2sq) if M2sq >= 0 else float('nan')
+    with np.errstate(invalid='ignore'):
+        return np.sqrt(M2sq)
 
 
 
 #==================================================
 #rayleigh mach from temperature ratio
 #==================================================
-def rayleigh_mach_from_temperature_ratio(mach_initial: float, temperature_initial: float, temperature_final: float, gas=air) -> float:
+def rayleigh_mach_from_temperature_ratio(mach_initial, temperature_initial, temperature_final, gas=air):
     """Return the Mach number given the Mach number and two temperatures
 
     Notes
     -----
     Given the initial Mach number, initial temperature, and final temperature, determine
     the resulting Mach number in the non-adiabatic constant area frictionless flow with 
-    heat transfer. Default fluid is air.
+    heat transfer. The temperature ratio is a quadratic in the square of the final Mach
+    number whose two roots lie either side of M = 1/sqrt(gamma), the root on the same side
+    as the initial Mach number is returned unless it would cross Mach one. A subsonic
+    initial Mach number then takes the lower root, and a supersonic one has no solution.
+    A sonic initial Mach number is taken to lie on the supersonic branch. Where no
+    solution exists the result is nan. Default fluid is air.
 
     Parameters
     ----------
-    mach : `float`
-        The Mach number\n
-    temperature_initial : `float`
+    mach_initial : `float` or `array_like`
+        The initial Mach number\n
+    temperature_initial : `float` or `array_like`
         Temperature 1\n
-    temperature_final : `float`
+    temperature_final : `float` or `array_like`
         Temperature 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
     
     Returns
     -------
-    float
+    float or ndarray
         The resulting Mach number \n
 
     Examples
@@ -297,48 +417,51 @@ def rayleigh_mach_from_temperature_ratio(mach_initial: float, temperature_initia
     """
 
     gamma = gas.gamma
-    T2_T1 = temperature_final/temperature_initial
-    def zero(mach_final, mach_initial, T2_T1,gas):
-        return rayleigh_temperature_ratio(mach_initial=mach_initial, mach_final=mach_final, gas=gas) - T2_T1
-    
-    if mach_initial < 1:
-        x0 = .5
-    elif mach_initial > 1:
-        x0 = 1.5
-    else:
-        x0 = 1
-
-    sol = fsolve(zero, args=(mach_initial, T2_T1, gas), x0=x0)
-    return sol[0]
+    mach_initial = np.asarray(mach_initial)
+    M1sq = mach_initial*mach_initial
+    T2_T1 = np.asarray(temperature_final)/np.asarray(temperature_initial)
+    #M2^2 / (1+gamma*M2^2)^2 = K, i.e. gamma^2*K*M2^4 + (2*gamma*K-1)*M2^2 + K = 0
+    a1 = 1 + gamma*M1sq
+    K = T2_T1 * M1sq/(a1*a1)
+    with np.errstate(invalid='ignore'):
+        B = 1 - 2*gamma*K + np.sqrt(1 - 4*gamma*K)
+        lower, upper = 2*K/B, B/(2*gamma*gamma*K)
+        #keep the final Mach number on the same side of Mach one as the initial
+        subsonic = np.where((gamma*M1sq >= 1) & (upper < 1), upper, lower)
+        mach_final = np.sqrt(np.where(mach_initial < 1, subsonic, np.where(upper >= 1, upper, np.nan)))
+    return mach_final
 
 
 
 #==================================================
 #rayleigh mach from stagnation temperature ratio
 #==================================================
-def rayleigh_mach_from_stagnation_temperature_ratio(mach_initial: float, stagnation_temperature_initial: float, stagnation_temperature_final: float, gas=air) -> float:
+def rayleigh_mach_from_stagnation_temperature_ratio(mach_initial, stagnation_temperature_initial, stagnation_temperature_final, gas=air):
     """Return the Mach number given the Mach number and two stagnation temperatures
 
     Notes
     -----
     Given the initial Mach number, initial stagnation temperature, and final stagnation
     temperature, determine the resulting Mach number in the non-adiabatic constant area
-    frictionless flow with heat transfer. Default fluid is air.
+    frictionless flow with heat transfer. The stagnation temperature ratio is a quadratic
+    in the square of the final Mach number, the root on the same side of Mach one as the
+    initial Mach number is returned, a sonic initial Mach number is taken to lie on the
+    supersonic branch. Where no solution exists the result is nan. Default fluid is air.
 
     Parameters
     ----------
-    mach_initial : `float`
-        The Mach number\n
-    stagnation_temperature_initial : `float`
+    mach_initial : `float` or `array_like`
+        The initial Mach number\n
+    stagnation_temperature_initial : `float` or `array_like`
         Stagnation temperature 1\n
-    stagnation_temperature_final : `float`
+    stagnation_temperature_final : `float` or `array_like`
         Stagnation temperature 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
     
     Returns
     -------
-    float
+    float or ndarray
         The resulting Mach number \n
 
 
@@ -353,48 +476,115 @@ def rayleigh_mach_from_stagnation_temperature_ratio(mach_initial: float, stagnat
     """
 
     gamma = gas.gamma
-    Tt2_Tt1 = stagnation_temperature_final/stagnation_temperature_initial
-    def zero(mach_final, mach_initial, Tt2_Tt1, gas):
-        return rayleigh_stagnation_temperature_ratio(mach_initial=mach_initial, mach_final=mach_final, gas=gas) - Tt2_Tt1
-    
-    if mach_initial < 1:
-        x0 = .5
-    elif mach_initial > 1:
-        x0 = 1.5
-    else:
-        x0 = 1
+    mach_initial = np.asarray(mach_initial)
+    Tt2_Tt1 = np.asarray(stagnation_temperature_final)/np.asarray(stagnation_temperature_initial)
+    #Tt2/Tt* = F gives (gamma^2*(1-F)-1)*M2^4 + 2*(1+gamma*(1-F))*M2^2 - F = 0
+    F = Tt2_Tt1 * rayleigh_stagnation_temperature_star_ratio(mach_initial, gas=gas)
+    d = 1 - F
+    with np.errstate(invalid='ignore'):
+        root = (gamma+1)*np.sqrt(d)
+        mach_final = np.sqrt(F/np.where(mach_initial < 1, 1 + gamma*d + root, 1 + gamma*d - root))
+    return mach_final
+
 
-    sol = fsolve(zero, args=(mach_initial, Tt2_Tt1, gas), x0=x0)
-    return sol[0]
+
+#==================================================
+#stagnation pressure newton solver
+#newton iteration on ln(pt/pt*) so the step stays well
+#scaled as pt/pt* grows rapidly with supersonic Mach,
+#safeguarded by bisection within the subsonic (0, 1) or
+#supersonic (1, inf) bracket of the starting point
+#==================================================
+def _stagnation_pressure_newton(pt_ptstar, x0, gamma, tol=1e-10, maxiter=100):
+    gamma, gm1_over_2, gamma_plus_1, gamma_over_gm1 = _gas_constants(gamma)
+    mach = np.where(np.isnan(pt_ptstar), np.nan, x0)
+    supersonic = x0 >= 1
+    lo = np.where(supersonic, 1., 0.)
+    hi = np.where(supersonic, np.inf, 1.)
+    for _ in range(maxiter):
+        Msq = mach*mach
+        residual = np.log(gamma_plus_1/(1 + gamma*Msq) * _isentropic_power((1 + gm1_over_2*Msq)/(gamma_plus_1/2), gamma_over_gm1) / pt_ptstar)
+        #pt/pt* falls with Mach below one and rises with Mach above one
+        too_high = (residual > 0) == supersonic
+        hi = np.where(too_high, mach, hi)
+        lo = np.where(too_high, lo, mach)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = mach - residual * ((1 + gm1_over_2*Msq)*(1 + gamma*Msq)) / (gamma*mach*(Msq-1))
+        bisect = np.where(np.isinf(hi), 2*lo, (lo + hi)/2)
+        step = np.where(np.isfinite(newton) & (newton >= lo) & (newton <= hi), newton, bisect) - mach
+        mach = mach + step
+        if not np.any(np.abs(step) > tol):
+            break
+    return mach
+
+
+
+#==================================================
+#stagnation pressure newton solver, scalar
+#the same bracketed newton iteration on plain floats,
+#with ln(pt/pt*) split into logs so large supersonic
+#Mach numbers cannot overflow the power
+#==================================================
+def _stagnation_pressure_newton_scalar(pt_ptstar, supersonic, gamma, tol=1e-10, maxiter=100):
+    gamma, gm1_over_2, gamma_plus_1, gamma_over_gm1 = _gas_constants(gamma)
+    log_pt_ptstar = log(pt_ptstar)
+    if supersonic:
+        mach, lo, hi = 1.5, 1., inf
+    else:
+        mach, lo, hi = .5, 0., 1.
+    for _ in range(maxiter):
+        Msq = mach*mach
+        a, b = 1 + gm1_over_2*Msq, 1 + gamma*Msq
+        residual = gamma_over_gm1*log(2*a/gamma_plus_1) - log(b/gamma_plus_1) - log_pt_ptstar
+        #pt/pt* falls with Mach below one and rises with Mach above one
+        if (residual > 0) == supersonic:
+            hi = mach
+        else:
+            lo = mach
+        slope = gamma*mach*(Msq - 1)
+        newton = mach - residual*a*b/slope if slope != 0 else -1.
+        if lo <= newton <= hi:
+            step = newton - mach
+        elif hi == inf:
+            step = 2*lo - mach
+        else:
+            step = (lo + hi)/2 - mach
+        mach += step
+        if abs(step) <= tol:
+            break
+    return mach
 
 
 
 #==================================================
 #rayleigh mach from stagnation pressure ratio
 #==================================================
-def rayleigh_mach_from_stagnation_pressure_ratio(mach_initial: float, stagnation_pressure_initial: float, stagnation_pressure_final: float, gas=air) -> float:
+def rayleigh_mach_from_stagnation_pressure_ratio(mach_initial, stagnation_pressure_initial, stagnation_pressure_final, gas=air):
     """Return the Mach number given the Mach number and two stagnation pressures
 
     Notes
     -----
     Given the initial Mach number, initial stagnation pressure, and final stagnation
     pressure, determine the resulting Mach number in the non-adiabatic constant area
-    frictionless flow with heat transfer. Default fluid is air.
+    frictionless flow with heat transfer. The Mach number is found with a bracketed
+    Newton's method on the same side of Mach one as the initial Mach number, a sonic
+    initial Mach number is taken to lie on the supersonic branch. Where no solution
+    exists the result is nan. Default fluid is air.
 
     Parameters
     ----------
-    M : `float`
-        The Mach number\n
-    stagnation_pressure_initial : `float`
+    mach_initial : `float` or `array_like`
+        The initial Mach number\n
+    stagnation_pressure_initial : `float` or `array_like`
         Stagnation pressure 1\n
-    stagnation_pressure_final : `float`
+    stagnation_pressure_final : `float` or `array_like`
         Stagnation pressure 2\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
     
     Returns
     -------
-    float
+    float or ndarray
         The resulting Mach number\n
 
     Examples
@@ -403,31 +593,33 @@ def rayleigh_mach_from_stagnation_pressure_ratio(mach_initial: float, stagnation
     >>> mach_initial, pt1, pt2 = .8, 2.3, 2.6
     >>> mach_final = gd.rayleigh_mach_from_stagnation_pressure_ratio(mach_initial, pt1, pt2)
     >>> mach_final
-    0.40992385119887326
+    0.4099238511988726
     >>>
     """
 
     gamma = gas.gamma
-    pt2_pt1 = stagnation_pressure_final/stagnation_pressure_initial
-    def zero(mach_final, mach_initial, pt2_pt1, gas):
-        return rayleigh_stagnation_pressure_ratio(mach_initial=mach_initial, mach_final=mach_final, gas=gas) - pt2_pt1
-
-    if mach_initial < 1:
-        x0 = .5
-    elif mach_initial > 1:
-        x0 = 1.5
-    else:
-        x0 = 1
-
-    sol = fsolve(zero, args=(mach_initial, pt2_pt1, gas), x0=x0)
-    return sol[0]
+    if type(mach_initial) is float and type(stagnation_pressure_initial) is float and type(stagnation_pressure_final) is float:
+        pt2_ptstar = stagnation_pressure_final/stagnation_pressure_initial * rayleigh_stagnation_pressure_star_ratio(mach_initial, gas=gas)
+        pt_ptstar_max = rayleigh_stagnation_pressure_star_ratio(0., gas=gas) if mach_initial < 1 else inf
+        if not 1 <= pt2_ptstar <= pt_ptstar_max:
+            return float('nan')
+        return _stagnation_pressure_newton_scalar(pt2_ptstar, mach_initial >= 1, gamma)
+    mach_initial = np.asarray(mach_initial)
+    pt2_pt1 = np.asarray(stagnation_pressure_final)/np.asarray(stagnation_pressure_initial)
+    pt2_ptstar = pt2_pt1 * rayleigh_stagnation_pressure_star_ratio(mach_initial, gas=gas)
+    #pt/pt* falls from its value at M = 0 to one at M = 1 and then rises without bound
+    pt_ptstar_max = np.where(mach_initial < 1, rayleigh_stagnation_pressure_star_ratio(0, gas=gas), np.inf)
+    pt2_ptstar = np.where((pt2_ptstar >= 1) & (pt2_ptstar <= pt_ptstar_max), pt2_ptstar, np.nan)
+    x0 = 1 + .5*np.sign(mach_initial - 1)
+    mach_final = _stagnation_pressure_newton(pt2_ptstar, x0, gamma)
+    return mach_final
 
 
 
 #==================================================
 #rayleigh pressure star ratio
 #==================================================
-def rayleigh_pressure_star_ratio(mach: float, gas=air) -> float:
+def rayleigh_pressure_star_ratio(mach, gas=air):
     """Return the ratio of pressure over pressure where Mach is equal to one
 
     Notes
@@ -438,14 +630,14 @@ def rayleigh_pressure_star_ratio(mach: float, gas=air) -> float:
 
     Parameters
     ----------
-    M : `flaot`
+    mach : `float` or `array_like`
         The Mach number \n
     gas : `fluid`
         A user defined fluid object. Default is air \n
 
     Returns
     -------
-    float
+    float or ndarray
         The ratio of p / p* \n
 
     Examples
@@ -459,7 +651,10 @@ def rayleigh_pressure_star_ratio(mach: float, gas=air) -> float:
     """
 
     gamma = gas.gamma
-    p_pstar = (gamma+1)/(1+gamma*mach**2)
+    if type(mach) is not float:
+        mach = np.asarray(mach)
+    Msq = mach*mach
+    p_pstar = (gamma+1)/(1+gamma*Msq)
     return p_pstar
 
 
@@ -467,7 +662,7 @@ def rayleigh_pressure_star_ratio(mach: float, gas=air) -> float:
 #==================================================
 #rayleigh temperature star ratio
 #==================================================
-def rayleigh_temperature_star_ratio(mach: float, gas=air) -> float:
+def rayleigh_temperature_star_ratio(mach, gas=air):
     """Return the ratio of temperature over temperature where Mach is equal to one
 
     Notes
@@ -478,14 +673,14 @@ def rayleigh_temperature_star_ratio(mach: float, gas=air) -> float:
 
     Parameters
     ----------
-    mach : `flaot`
+    mach : `float` or `array_like`
         The Mach number\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
 
     Returns
     -------
-    float
+    float or ndarray
         The ratio of T / T* \n
 
     Examples
@@ -499,7 +694,11 @@ def rayleigh_temperature_star_ratio(mach: float, gas=air) -> float:
     """
 
     gamma = gas.gamma
-    T_Tstar = (mach**2 * (1+gamma)**2) / (1+gamma*mach**2)**2
+    if type(mach) is not float:
+        mach = np.asarray(mach)
+    Msq = mach*mach
+    a = 1 + gamma*Msq
+    T_Tstar = (Msq * (1+gamma)*(1+gamma)) / (a*a)
     return T_Tstar
 
 
@@ -509,7 +708,7 @@ def rayleigh_temperature_star_ratio(mach: float, gas=air) -> float:
 #TODO: docstring and examples
 #TODO: verify
 #==================================================
-def rayleigh_density_star_ratio(mach: float, gas=air) -> float:
+def rayleigh_density_star_ratio(mach, gas=air):
     """Return the ratio of density over density where Mach is equal to one
 
     Notes
@@ -520,14 +719,14 @@ def rayleigh_density_star_ratio(mach: float, gas=air) -> float:
 
     Parameters
     ----------
-    mach : `flaot`
+    mach : `float` or `array_like`
         The Mach number\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
 
     Returns
     -------
-    float
+    float or ndarray
         The ratio of rho / rho* \n
 
     Examples
@@ -536,7 +735,10 @@ def rayleigh_density_star_ratio(mach: float, gas=air) -> float:
     """
 
     gamma = gas.gamma
-    rho_rhostar = (1+gamma*mach**2)/((1+gamma)*mach**2)
+    if type(mach) is not float:
+        mach = np.asarray(mach)
+    Msq = mach*mach
+    rho_rhostar = (1+gamma*Msq)/((1+gamma)*Msq)
     return rho_rhostar
 
 
@@ -544,7 +746,7 @@ def rayleigh_density_star_ratio(mach: float, gas=air) -> float:
 #==================================================
 #rayleigh stagnation pressure star ratio
 #==================================================
-def rayleigh_stagnation_pressure_star_ratio(mach: float, gas=air) -> float:
+def rayleigh_stagnation_pressure_star_ratio(mach, gas=air):
     """Return the ratio of stagnation pressure over stagnation pressure where 
     Mach is equal to one
 
@@ -556,14 +758,14 @@ def rayleigh_stagnation_pressure_star_ratio(mach: float, gas=air) -> float:
 
     Parameters
     ----------
-    mach : `flaot`
+    mach : `float` or `array_like`
         The Mach number\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
 
     Returns
     -------
-    float
+    float or ndarray
         The ratio of pt / pt* \n
 
     Examples
@@ -576,8 +778,11 @@ def rayleigh_stagnation_pressure_star_ratio(mach: float, gas=air) -> float:
     >>>
     """
 
-    gamma = gas.gamma
-    pt_ptstar = (1+gamma) / (1 + gamma*mach**2) * ((1 + (gamma-1)/2 * mach**2)/((gamma+1)/2))**(gamma/(gamma-1))
+    gamma, gm1_over_2, gamma_plus_1, gamma_over_gm1 = _gas_constants(gas.gamma)
+    if type(mach) is not float:
+        mach = np.asarray(mach)
+    Msq = mach*mach
+    pt_ptstar = gamma_plus_1 / (1 + gamma*Msq) * _isentropic_power((1 + gm1_over_2 * Msq)/(gamma_plus_1/2), gamma_over_gm1)
     return pt_ptstar
 
 
@@ -585,7 +790,7 @@ def rayleigh_stagnation_pressure_star_ratio(mach: float, gas=air) -> float:
 #==================================================
 #rayleigh stagnation temperature star ratio
 #==================================================
-def rayleigh_stagnation_temperature_star_ratio(mach: float, gas=air) -> float:
+def rayleigh_stagnation_temperature_star_ratio(mach, gas=air):
     """Return the ratio of stagnation temperature over stagnation temperature where 
     Mach is equal to one
 
@@ -597,14 +802,14 @@ def rayleigh_stagnation_temperature_star_ratio(mach: float, gas=air) -> float:
 
     Parameters
     ----------
-    mach : `flaot`
+    mach : `float` or `array_like`
         The Mach number\n
     gas : `fluid`
         A user defined fluid object. Default is air \n
 
     Returns
     -------
-    float
+    float or ndarray
         The ratio of Tt / Tt* \n
 
     Examples
@@ -617,11 +822,81 @@ def rayleigh_stagnation_temperature_star_ratio(mach: float, gas=air) -> float:
     >>>
     """
 
-    gamma = gas.gamma
-    Tt_Ttstar = (2*(gamma+1)*mach**2)/((1+gamma*mach**2)**2) * (1 + (gamma-1)/2 * mach**2)
+    gamma, gm1_over_2, gamma_plus_1, _ = _gas_constants(gas.gamma)
+    if type(mach) is not float:
+        mach = np.asarray(mach)
+    Msq = mach*mach
+    a = 1 + gamma*Msq
+    Tt_Ttstar = (2*gamma_plus_1*Msq)/(a*a) * (1 + gm1_over_2 * Msq)
     return Tt_Ttstar
 
 
+#==================================================
+#rayleigh star ratios
+#==================================================
+rayleigh_star_ratios = namedtuple('rayleigh_star_ratios', ['p_pstar', 'T_Tstar', 'rho_rhostar', 'pt_ptstar', 'Tt_Ttstar'])
+
+
+def rayleigh_all_star_ratios(mach, gas=air, dtype=None) -> rayleigh_star_ratios:
+    """Return the pressure, temperature, density, stagnation pressure and stagnation
+    temperature ratios over their values where Mach is equal to one
+
+    Notes
+    -----
+    Given a Mach number, determine all five of the star ratios for a non-adiabatic
+    frictionless constant area system in a single pass. The subexpressions shared
+    between the ratios are evaluated once, which makes this the cheapest way to
+    build Rayleigh tables over many Mach numbers. Default fluid is air.
+
+    Parameters
+    ----------
+    mach : `float` or `array_like`
+        The Mach number\n
+    gas : `fluid`
+        A user defined fluid object. Default is air \n
+    dtype : `data-type`
+        The floating point type to compute in, such as np.float32 for large sweeps
+        where single precision is enough, must be a floating point type. Default keeps
+        the precision of the input \n
+
+    Returns
+    -------
+    rayleigh_star_ratios
+        A named tuple of p_pstar, T_Tstar, rho_rhostar, pt_ptstar, and Tt_Ttstar \n
+
+    Examples
+    --------
+    >>> import gas_dynamics as gd
+    >>> M = 2
+    >>> ratios = gd.rayleigh_all_star_ratios(M)
+    >>> ratios.T_Tstar
+    0.5289256198347108
+    >>> ratios.pt_ptstar
+    1.5030959785260414
+    >>>
+    """
+
+    gamma, gm1_over_2, gamma_plus_1, gamma_over_gm1 = _gas_constants(float(gas.gamma))
+    if dtype is None:
+        if type(mach) is not float:
+            mach = np.asarray(mach)
+    else:
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError('dtype must be a floating point type, got %s' % np.dtype(dtype))
+        mach = np.asarray(mach, dtype=dtype)
+        cast = np.dtype(dtype).type
+        gamma, gm1_over_2, gamma_plus_1 = cast(gamma), cast(gm1_over_2), cast(gamma_plus_1)
+    Msq = mach*mach
+    p_pstar = gamma_plus_1/(1 + gamma*Msq)
+    T_Tstar = Msq*p_pstar*p_pstar
+    rho_rhostar = 1/(Msq*p_pstar)
+    Tt_ratio = (1 + gm1_over_2*Msq)/(gamma_plus_1/2)
+    pt_ptstar = p_pstar*_isentropic_power(Tt_ratio, gamma_over_gm1)
+    Tt_Ttstar = T_Tstar*Tt_ratio
+    return rayleigh_star_ratios(p_pstar, T_Tstar, rho_rhostar, pt_ptstar, Tt_Ttstar)
+
+
+
 #==================================================
 #rayleigh heat flux
 #==================================================
@@ -3,6 +3,8 @@
 #########################
 import gas_dynamics as gd
 from gas_dynamics.fluids import air, methane
+import numpy as np
+import pytest
 import random
 
 #TODO: these tests only test for float, not for actual correct values.
@@ -18,6 +20,13 @@ class Test_rayleigh_pressure_ratio:
         a = random.uniform(1.01,10)
         assert gd.rayleigh_pressure_ratio(a,a) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        b = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_pressure_ratio(a,b)
+        assert ratios.shape == a.shape
+        assert np.allclose(ratios, [gd.rayleigh_pressure_ratio(x,y) for x,y in zip(a,b)])
+
 
 class Test_rayleigh_temperature_ratio:
     def test_one(self):
@@ -29,6 +38,13 @@ class Test_rayleigh_temperature_ratio:
         a = random.uniform(1.01,10)
         assert gd.rayleigh_temperature_ratio(a,a) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        b = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_temperature_ratio(a,b)
+        assert ratios.shape == a.shape
+        assert np.allclose(ratios, [gd.rayleigh_temperature_ratio(x,y) for x,y in zip(a,b)])
+
 
 class Test_rayleigh_density_ratio:
     def test_one(self):
@@ -40,6 +56,13 @@ class Test_rayleigh_density_ratio:
         a = random.uniform(1.01,10)
         assert gd.rayleigh_density_ratio(a,a) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        b = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_density_ratio(a,b)
+        assert ratios.shape == a.shape
+        assert np.allclose(ratios, [gd.rayleigh_density_ratio(x,y) for x,y in zip(a,b)])
+
 
 class Test_rayleigh_stagnation_temperature_ratio:
     def test_one(self):
@@ -51,6 +74,13 @@ class Test_rayleigh_stagnation_temperature_ratio:
         a = random.uniform(1.01,10)
         assert gd.rayleigh_stagnation_temperature_ratio(a,a) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        b = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_stagnation_temperature_ratio(a,b)
+        assert ratios.shape == a.shape
+        assert np.allclose(ratios, [gd.rayleigh_stagnation_temperature_ratio(x,y) for x,y in zip(a,b)])
+
 
 class Test_rayleigh_stagnation_pressure_ratio:
     def test_one(self):
@@ -62,6 +92,47 @@ class Test_rayleigh_stagnation_pressure_ratio:
         a = random.uniform(1.01,10)
         assert gd.rayleigh_stagnation_pressure_ratio(a,a) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        b = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_stagnation_pressure_ratio(a,b)
+        assert ratios.shape == a.shape
+        assert np.allclose(ratios, [gd.rayleigh_stagnation_pressure_ratio(x,y) for x,y in zip(a,b)])
+
+
+class Test_rayleigh_all_ratios:
+    def test_one(self):
+        a = np.random.uniform(.1,10,size=50)
+        b = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_all_ratios(a,b,methane)
+        assert np.allclose(ratios.p2_p1, gd.rayleigh_pressure_ratio(a,b,methane))
+        assert np.allclose(ratios.T2_T1, gd.rayleigh_temperature_ratio(a,b,methane))
+        assert np.allclose(ratios.rho2_rho1, gd.rayleigh_density_ratio(a,b,methane))
+        assert np.allclose(ratios.Tt2_Tt1, gd.rayleigh_stagnation_temperature_ratio(a,b,methane))
+        assert np.allclose(ratios.pt2_pt1, gd.rayleigh_stagnation_pressure_ratio(a,b,methane))
+
+    def test_float32(self):
+        a = np.random.uniform(.1,10,size=50)
+        b = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_all_ratios(a,b,dtype=np.float32)
+        assert all(ratio.dtype == np.float32 for ratio in ratios)
+        assert np.allclose(ratios, gd.rayleigh_all_ratios(a,b), rtol=1e-5)
+
+    def test_integer_dtype(self):
+        with pytest.raises(ValueError):
+            gd.rayleigh_all_ratios(np.array([.5, 2]), np.array([.8, 3]), dtype=np.int32)
+
+
+class Test_rayleigh_float32_cache:
+    def test_one(self):
+        gas = gd.fluid('test', 1.5, 287)
+        gd.rayleigh_all_ratios(.5, .3, gas, dtype=np.float32)
+        gd.rayleigh_all_star_ratios(.5, gas, dtype=np.float32)
+        assert type(gd.rayleigh_stagnation_pressure_ratio(.5, .3, gas)) is float
+        assert type(gd.rayleigh_stagnation_temperature_ratio(.5, .3, gas)) is float
+        assert type(gd.rayleigh_stagnation_pressure_star_ratio(.5, gas)) is float
+        assert type(gd.rayleigh_all_ratios(.5, .3, gas).pt2_pt1) is float
+
 
 class Test_rayleigh_mach_from_pressure_ratio:
     def test_one(self):
@@ -70,6 +141,17 @@ class Test_rayleigh_mach_from_pressure_ratio:
         m = random.uniform(1.01,10)
         assert float(gd.rayleigh_mach_from_pressure_ratio(m,a,b))
 
+    def test_array(self):
+        a = np.random.uniform(.1,.8,size=50)
+        b = np.random.uniform(.1,.8,size=50)
+        p2_p1 = gd.rayleigh_pressure_ratio(a,b)
+        assert np.allclose(gd.rayleigh_mach_from_pressure_ratio(a,1,p2_p1), b)
+
+    def test_two(self):
+        #a pressure rise past the M = 0 limit has no real Mach number
+        assert np.isnan(gd.rayleigh_mach_from_pressure_ratio(.5, 1, 5))
+        assert np.isnan(gd.rayleigh_mach_from_pressure_ratio(np.array([.5, .8]), 1, 5)).all()
+
 
 class Test_rayleigh_mach_from_temperature_ratio:
     def test_one(self):
@@ -78,6 +160,28 @@ class Test_rayleigh_mach_from_temperature_ratio:
         m = random.uniform(1.01,10)
         assert float(gd.rayleigh_mach_from_temperature_ratio(m,a,b))
 
+    def test_two(self):
+        a = random.uniform(.1,.8)
+        b = random.uniform(.1,.8)
+        T2_T1 = gd.rayleigh_temperature_ratio(a,b)
+        assert np.isclose(gd.rayleigh_mach_from_temperature_ratio(a,1,T2_T1), b)
+
+    def test_three(self):
+        a = random.uniform(1/1.4**.5,.99)
+        b = random.uniform(a,.99)
+        T2_T1 = gd.rayleigh_temperature_ratio(a,b)
+        assert np.isclose(gd.rayleigh_mach_from_temperature_ratio(a,1,T2_T1), b)
+        T2_T1 = gd.rayleigh_temperature_ratio(a,1.5)
+        assert gd.rayleigh_mach_from_temperature_ratio(a,1,T2_T1) < 1
+
+    def test_four(self):
+        a = np.random.uniform(1.01,10,size=50)
+        b = np.random.uniform(1.01,10,size=50)
+        T2_T1 = gd.rayleigh_temperature_ratio(a,b)
+        assert np.allclose(gd.rayleigh_mach_from_temperature_ratio(a,1,T2_T1), b)
+        T2_T1 = gd.rayleigh_temperature_ratio(2,.9)
+        assert np.isnan(gd.rayleigh_mach_from_temperature_ratio(2,1,T2_T1))
+
 
 #TODO: this isn't great
 class Test_rayleigh_mach_from_stagnation_temperature_ratio:
@@ -87,6 +191,30 @@ class Test_rayleigh_mach_from_stagnation_temperature_ratio:
         m = random.uniform(1.01,5)
         assert float(gd.rayleigh_mach_from_stagnation_temperature_ratio(m,b,a))
 
+    def test_two(self):
+        a = random.uniform(.1,.99)
+        b = random.uniform(.1,.99)
+        Tt2_Tt1 = gd.rayleigh_stagnation_temperature_ratio(a,b)
+        assert np.isclose(gd.rayleigh_mach_from_stagnation_temperature_ratio(a,1,Tt2_Tt1), b)
+
+    def test_three(self):
+        a = np.random.uniform(1.01,20,size=50)
+        b = np.random.uniform(1.01,20,size=50)
+        Tt2_Tt1 = gd.rayleigh_stagnation_temperature_ratio(a,b)
+        assert np.allclose(gd.rayleigh_mach_from_stagnation_temperature_ratio(a,1,Tt2_Tt1), b)
+
+    def test_four(self):
+        #Tt2/Tt* cannot exceed one
+        a = random.uniform(.1,.95)
+        Tt2_Tt1 = 1.01/gd.rayleigh_stagnation_temperature_star_ratio(a)
+        assert np.isnan(gd.rayleigh_mach_from_stagnation_temperature_ratio(a,1,Tt2_Tt1))
+
+    def test_five(self):
+        #supersonic Tt2/Tt* cannot fall below (gamma^2-1)/gamma^2
+        a = random.uniform(1.01,5)
+        Tt2_Tt1 = .99*(air.gamma**2-1)/air.gamma**2/gd.rayleigh_stagnation_temperature_star_ratio(a)
+        assert np.isnan(gd.rayleigh_mach_from_stagnation_temperature_ratio(a,1,Tt2_Tt1))
+
 
 class Test_rayleigh_mach_from_stagnation_pressure_ratio:
     def test_one(self):
@@ -95,6 +223,39 @@ class Test_rayleigh_mach_from_stagnation_pressure_ratio:
         m = random.uniform(1.01,5)
         assert float(gd.rayleigh_mach_from_stagnation_pressure_ratio(m,b,a))
 
+    def test_two(self):
+        a = random.uniform(.1,.95)
+        b = random.uniform(.1,.95)
+        pt2_pt1 = gd.rayleigh_stagnation_pressure_ratio(a,b)
+        assert np.isclose(gd.rayleigh_mach_from_stagnation_pressure_ratio(a,1,pt2_pt1), b)
+
+    def test_three(self):
+        a = np.random.uniform(1,20,size=50)
+        b = np.random.uniform(1.01,20,size=50)
+        pt2_pt1 = gd.rayleigh_stagnation_pressure_ratio(a,b)
+        assert np.allclose(gd.rayleigh_mach_from_stagnation_pressure_ratio(a,1,pt2_pt1), b)
+
+    def test_four(self):
+        #a sonic start takes the supersonic branch
+        a = gd.rayleigh_mach_from_stagnation_pressure_ratio(1., 1., 1.2)
+        b = gd.rayleigh_mach_from_stagnation_pressure_ratio(1, 1, 1.2)
+        assert a > 1 and np.isclose(a, b)
+        assert np.isclose(gd.rayleigh_stagnation_pressure_ratio(1, a), 1.2)
+
+    def test_five(self):
+        #subsonic pt2/pt* above its value at M = 0 has no solution
+        a = random.uniform(.1,.95)
+        pt2_pt1 = 1.01*gd.rayleigh_stagnation_pressure_star_ratio(0)/gd.rayleigh_stagnation_pressure_star_ratio(a)
+        assert np.isnan(gd.rayleigh_mach_from_stagnation_pressure_ratio(a,1.,pt2_pt1))
+        assert np.isnan(gd.rayleigh_mach_from_stagnation_pressure_ratio(np.array([a]),1,pt2_pt1)).all()
+
+    def test_six(self):
+        #supersonic pt2/pt* below one has no solution
+        a = random.uniform(1.01,5)
+        pt2_pt1 = .99/gd.rayleigh_stagnation_pressure_star_ratio(a)
+        assert np.isnan(gd.rayleigh_mach_from_stagnation_pressure_ratio(a,1.,pt2_pt1))
+        assert np.isnan(gd.rayleigh_mach_from_stagnation_pressure_ratio(np.array([a]),1,pt2_pt1)).all()
+
 
 class Test_rayleigh_pressure_star_ratio:
     def test_one(self):
@@ -104,6 +265,10 @@ class Test_rayleigh_pressure_star_ratio:
     def test_two(self):
         assert float(gd.rayleigh_pressure_star_ratio(1)) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        assert np.allclose(gd.rayleigh_pressure_star_ratio(list(a)), [gd.rayleigh_pressure_star_ratio(x) for x in a])
+
 
 class Test_rayleigh_temperature_star_ratio:
     def test_one(self):
@@ -113,6 +278,10 @@ class Test_rayleigh_temperature_star_ratio:
     def test_two(self):
         assert float(gd.rayleigh_temperature_star_ratio(1)) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        assert np.allclose(gd.rayleigh_temperature_star_ratio(list(a)), [gd.rayleigh_temperature_star_ratio(x) for x in a])
+
 
 class Test_rayleigh_density_star_ratio:
     def test_one(self):
@@ -122,6 +291,10 @@ class Test_rayleigh_density_star_ratio:
     def test_two(self):
         assert float(gd.rayleigh_density_star_ratio(1)) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        assert np.allclose(gd.rayleigh_density_star_ratio(list(a)), [gd.rayleigh_density_star_ratio(x) for x in a])
+
 
 class Test_rayleigh_stagnation_pressure_star_ratio:
     def test_one(self):
@@ -131,6 +304,10 @@ class Test_rayleigh_stagnation_pressure_star_ratio:
     def test_two(self):
         assert float(gd.rayleigh_stagnation_pressure_star_ratio(1)) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        assert np.allclose(gd.rayleigh_stagnation_pressure_star_ratio(list(a)), [gd.rayleigh_stagnation_pressure_star_ratio(x) for x in a])
+
 
 class Test_rayleigh_stagnation_temperature_star_ratio:
     def test_one(self):
@@ -140,6 +317,34 @@ class Test_rayleigh_stagnation_temperature_star_ratio:
     def test_two(self):
         assert float(gd.rayleigh_stagnation_temperature_star_ratio(1)) == 1
 
+    def test_array(self):
+        a = np.random.uniform(.1,10,size=50)
+        assert np.allclose(gd.rayleigh_stagnation_temperature_star_ratio(list(a)), [gd.rayleigh_stagnation_temperature_star_ratio(x) for x in a])
+
+
+class Test_rayleigh_all_star_ratios:
+    def test_one(self):
+        a = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_all_star_ratios(a,methane)
+        assert np.allclose(ratios.p_pstar, gd.rayleigh_pressure_star_ratio(a,methane))
+        assert np.allclose(ratios.T_Tstar, gd.rayleigh_temperature_star_ratio(a,methane))
+        assert np.allclose(ratios.rho_rhostar, gd.rayleigh_density_star_ratio(a,methane))
+        assert np.allclose(ratios.pt_ptstar, gd.rayleigh_stagnation_pressure_star_ratio(a,methane))
+        assert np.allclose(ratios.Tt_Ttstar, gd.rayleigh_stagnation_temperature_star_ratio(a,methane))
+
+    def test_float32(self):
+        a = np.random.uniform(.1,10,size=50)
+        ratios = gd.rayleigh_all_star_ratios(a,dtype=np.float32)
+        assert all(ratio.dtype == np.float32 for ratio in ratios)
+        assert np.allclose(ratios, gd.rayleigh_all_star_ratios(a), rtol=1e-5)
+
+    def test_integer_dtype(self):
+        with pytest.raises(ValueError):
+            gd.rayleigh_all_star_ratios(np.array([.5, 2]), dtype=int)
+
+    def test_two(self):
+        assert np.allclose(gd.rayleigh_all_star_ratios(1), 1)
+
 
 class Test_rayleigh_heat_flux:
     def test_one(self):